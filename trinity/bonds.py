@@ -1,5 +1,10 @@
 """Bond fund simulation."""
-import collections
+
+
+# Weights used to estimate the interest rate for bonds with
+# 1-10 years until maturity by linear interpolation between
+# the 1-year and 10-year rates.
+RATE_WEIGHTS = tuple(n / 9 for n in range(10))
 
 
 def simulate_returns(rates):
@@ -27,54 +32,68 @@ def simulate_returns(rates):
     """
     rates = iter(rates)
 
-    ladder = collections.deque(maxlen=10)
+    # The ladder is stored as parallel lists of par values and
+    # coupon rates used as a ring buffer. `head` is the index of
+    # the bond closest to maturity.
+    head = 0
     rate, rate_long = next(rates)
-    init_ladder(ladder, rate_long)
-    nav = calc_nav(ladder, rate, rate_long)
+    pars, coupons = init_ladder(rate_long)
+    nav = calc_nav(pars, coupons, head, rate, rate_long)
 
     returns = []
     for rate, rate_long in rates:
-        step(ladder, rate_long)
-        tmp = calc_nav(ladder, rate, rate_long)
-        total_return = round(tmp / nav - 1, 4)
-        returns.append(total_return)
+        head = step(pars, coupons, head, rate_long)
+        tmp = calc_nav(pars, coupons, head, rate, rate_long)
+        returns.append(tmp / nav - 1)
         nav = tmp
 
-    return returns
+    return [round(total_return, 4) for total_return in returns]
 
 
-def step(ladder, rate_long):
+def step(pars, coupons, head, rate_long):
     """Advance the bond ladder by one year.
 
     Sells the bond in the ladder with one year left until
     maturity and buys a new 10-year bond at the current
-    interest rate.
+    interest rate. The new bond replaces the sold bond
+    in place.
 
     Parameters
     ----------
-    ladder : collections.deque
-        A bond ladder.
+    pars, coupons : list of float
+        Par values and coupon rates of the bonds in the ladder.
+    head : int
+        Index of the bond with one year left until maturity.
     rate_long : float
         Current 10-year interest rate.
+
+    Returns
+    -------
+    int
+        Index of the bond now closest to maturity.
     """
     # Sum payments received this year.
-    capital = sum(rate*par for rate, par in ladder)
+    capital = sum(coupon*par for coupon, par in zip(coupons, pars))
 
     # Sell bond with one year left until maturity.
-    par, _ = ladder.popleft()
-    capital += par
+    capital += pars[head]
 
     # Purchase new bond at current 10-year rate.
-    ladder.append((capital, rate_long))
+    pars[head] = capital
+    coupons[head] = rate_long
+
+    return (head + 1) % 10
 
 
-def calc_nav(ladder, rate, rate_long):
+def calc_nav(pars, coupons, head, rate, rate_long):
     """Calculate the net asset value of a fund.
 
     Parameters
     ----------
-    ladder : collections.deque
-        A bond ladder.
+    pars, coupons : list of float
+        Par values and coupon rates of the bonds in the ladder.
+    head : int
+        Index of the bond closest to maturity.
     rate : float
         Current 1-year interest rate.
     rate_long : float
@@ -83,16 +102,27 @@ def calc_nav(ladder, rate, rate_long):
     Returns
     -------
     float
-        Approximate value of the assets in `ladder`.
+        Approximate value of the assets in the ladder.
     """
+    spread = rate_long - rate
+
     nav = 0.0
-    for i, (par, bond_rate) in enumerate(ladder, 1):
-        current_rate = calc_rate(rate, rate_long, i)
-        nav -= pv(current_rate, i, par*bond_rate, par)
+    for i, weight in enumerate(RATE_WEIGHTS, 1):
+        k = (head + i - 1) % 10
+        par, coupon = pars[k], coupons[k]
+
+        # Present value of the remaining coupon payments
+        # plus the par value received at maturity.
+        current_rate = rate + spread*weight
+        if current_rate == 0:
+            nav += par * (1 + coupon*i)
+        else:
+            discount = (1 + current_rate)**-i
+            nav += par * (discount + coupon*(1 - discount) / current_rate)
     return nav
 
 
-def init_ladder(ladder, rate):
+def init_ladder(rate):
     """Initialize a bond ladder.
 
     The ladder is bootstrapped by buying 10 bonds
@@ -103,61 +133,18 @@ def init_ladder(ladder, rate):
 
     Parameters
     ----------
-    ladder : collections.deque
-        Empty bond ladder.
     rate : float
         Initial 10-year rate.
-    """
-    for n in range(10):
-        par = (1 + rate)**n
-        ladder.append((par, rate))
-
-
-def calc_rate(rate, rate_long, maturity):
-    """Approximate a current interest rate.
-
-    Permforms linear interpolation based on the current
-    1-year and 10-year rates and the maturity of the
-    bond.
-
-    Parameters
-    ----------
-    rate : float
-        1-year interest rate.
-    rate_long : float
-        10-year interest rate.
-    maturity : int
-        Maturity of the bond in years.
-
-    Returns
-    -------
-    float
-        Approximated interest rate.
-    """
-    return rate + (rate_long - rate)*(maturity - 1) / 9
-
-
-def pv(rate, nper, pmt, fv):
-    """Calculate the present value of an asset.
-
-    Parameters
-    ----------
-    rate : float
-        Interest rate per period.
-    nper : int
-        Number of payment periods.
-    pmt : float
-        Constant payment made each period.
-    fv : float
-        Future value, i.e., balance after the last
-        payment is made.
 
     Returns
     -------
-    float
+    pars, coupons : list of float
+        Par values and coupon rates of the bonds in the
+        ladder, ordered from shortest to longest maturity.
     """
-    if rate == 0:
-        return -(fv + pmt*nper)
-    else:
-        tmp = (1 + rate)**nper
-        return -(fv + pmt*(tmp - 1) / rate) / tmp
+    pars = []
+    par = 1.0
+    for _ in range(10):
+        pars.append(par)
+        par *= 1 + rate
+    return pars, [rate] * 10
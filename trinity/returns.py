@@ -1,5 +1,6 @@
 """Tools for calculating historical market returns."""
 import csv
+import functools
 import io
 import pkgutil
 
@@ -25,46 +26,82 @@ def get_returns(start_year=None, end_year=None):
         keys "stocks" and "bonds". Each value represents
         an inflation-adjusted annual return.
     """
-    shiller = read_shiller()
-    bond_returns = get_bond_returns(shiller)
+    years, stocks, bonds = all_returns()
 
     returns = {}
-    for current, future in zip(shiller[:-1], shiller[1:]):
-        year = current['year']
+    for year, stock_return, bond_return in zip(years, stocks, bonds):
         if start_year is not None and year < start_year:
             continue
         elif end_year is not None and year > end_year:
             break
         else:
-            returns[year] = annual_returns(current, future, bond_returns[year])
+            returns[year] = {'stocks': stock_return, 'bonds': bond_return}
 
     return returns
 
 
-def annual_returns(current, future, bond_return):
-    """Calculate returns from successive years of Shiller data.
+@functools.lru_cache(maxsize=None)
+def all_returns():
+    """Calculate market returns for every year of Shiller data.
+
+    The result is cached, so the data set is read and the
+    bond fund simulated at most once per process.
+
+    Returns
+    -------
+    years : tuple of int
+        Years with return data.
+    stocks, bonds : tuple of float
+        Real stock and bond returns, one entry per year.
+    """
+    shiller = read_shiller()
+    bond_returns = get_bond_returns(shiller)
+    stock_returns = get_stock_returns(shiller)
+    inflation = get_inflation(shiller)
+
+    stocks = tuple(map(real_return, stock_returns, inflation))
+    bonds = tuple(map(real_return, bond_returns, inflation))
+    return shiller['year'][:-1], stocks, bonds
+
+
+def get_stock_returns(shiller):
+    """Get nominal stock returns by year.
 
     Parameters
     ----------
-    current, future : dict
-        Shiller data for the current year and the next year.
-    bond_return : float
-        Simulated nominal bond return for the current year.
+    shiller : dict of tuple
+        Raw data from the Shiller data set.
 
     Returns
     -------
-    dict
-        Real stock and bond returns for this year.
+    list of float
+        Price appreciation plus dividends, aligned with the
+        years in `shiller`. There is no return for the final
+        year.
     """
-    inflation = future['cpi'] / current['cpi'] - 1
+    price, dividends = shiller['price'], shiller['dividends']
+    return [(future + dividend - current) / current
+            for current, future, dividend
+            in zip(price[:-1], price[1:], dividends)]
 
-    stock_return = real_return(
-        ((future['price']
-          + current['dividends']
-          - current['price']) / current['price']), inflation)
-    bond_return = real_return(bond_return, inflation)
 
-    return {'stocks': stock_return, 'bonds': bond_return}
+def get_inflation(shiller):
+    """Get inflation rates by year.
+
+    Parameters
+    ----------
+    shiller : dict of tuple
+        Raw data from the Shiller data set.
+
+    Returns
+    -------
+    list of float
+        Change in CPI, aligned with the years in `shiller`.
+        There is no rate for the final year.
+    """
+    cpi = shiller['cpi']
+    return [future / current - 1
+            for current, future in zip(cpi[:-1], cpi[1:])]
 
 
 def real_return(nominal_return, inflation_rate):
@@ -90,21 +127,17 @@ def get_bond_returns(shiller):
 
     Parameters
     ----------
-    shiller : list of dict
+    shiller : dict of tuple
         Raw data from the Shiller data set.
 
     Returns
     -------
-    dict
-        Nominal bond returns by year.
+    list of float
+        Nominal bond returns, aligned with the years in
+        `shiller`. There is no return for the final year.
     """
-    years, interest_rates = zip(
-        *[(row['year'],
-           (row['rate'], row['rate_long']))
-          for row in shiller]
-    )
-    bond_returns = bonds.simulate_returns(interest_rates)
-    return dict(zip(years, bond_returns))
+    return bonds.simulate_returns(
+        zip(shiller['rate'], shiller['rate_long']))
 
 
 def read_shiller():
@@ -112,16 +145,21 @@ def read_shiller():
 
     Returns
     -------
-    list of dict
-        Market data by year.
+    dict of tuple
+        Market data by column. Keys are "year", "price",
+        "dividends", "rate", "rate_long" and "cpi", and each
+        value holds one entry per year.
     """
     raw = pkgutil.get_data(__name__, 'data/shiller.csv')
-    buf = io.StringIO(raw.decode())
-    reader = csv.DictReader(buf)
-    return [{'year': int(row['YEAR']),
-             'price': float(row['P']),
-             'dividends': float(row['D']),
-             'rate': float(row['R']) / 100.0,
-             'rate_long': float(row['RLONG']) / 100.0,
-             'cpi': float(row['CPI'])}
-            for row in reader]
+    reader = csv.reader(io.StringIO(raw.decode()))
+
+    # Transpose rows into columns keyed by the header.
+    header = next(reader)
+    columns = dict(zip(header, zip(*reader)))
+
+    return {'year': tuple(map(int, columns['YEAR'])),
+            'price': tuple(map(float, columns['P'])),
+            'dividends': tuple(map(float, columns['D'])),
+            'rate': tuple(float(x) / 100.0 for x in columns['R']),
+            'rate_long': tuple(float(x) / 100.0 for x in columns['RLONG']),
+            'cpi': tuple(map(float, columns['CPI']))}
@@ -1,9 +1,16 @@
 """Tools for simulating retirement outcomes."""
 import argparse
+import itertools
+import operator
 
 from trinity.returns import get_returns
 
 
+# Simulations are independent of initial portfolio size,
+# so use a fixed, realistic number.
+INITIAL_BALANCE = 1_000_000
+
+
 def main():
     """Simulate historical portfolio success rates."""
     parser = argparse.ArgumentParser(description='Retirement calculator')
@@ -67,11 +74,36 @@ def calc_success_rate(returns, stock_allocation, duration, withdrawal_rate):
         The fraction of periods for which the portfolio
         survived, rounded to two decimal places.
     """
-    periods = get_periods(min(returns), max(returns), duration)
-    successes = sum(
-        simulate(returns, *period, stock_allocation, withdrawal_rate)
-        for period in periods
-    )
+    first_year, last_year = min(returns), max(returns)
+
+    stocks, bonds = extract_returns(returns, first_year, last_year)
+    growth = growth_factors(stocks, bonds, stock_allocation)
+
+    periods = get_periods(first_year, last_year, duration)
+
+    if any(factor <= 0 for factor in growth):
+        # The closed form below does not hold, e.g. for leveraged
+        # or short allocations, so simulate each period directly.
+        successes = sum(
+            simulate(returns, *period, stock_allocation, withdrawal_rate)
+            for period in periods)
+    else:
+        # Each year the balance b becomes b*g - w. Unrolling this over
+        # a period, the final balance is positive exactly when
+        #
+        #     w/b0 * sum(1 / (g[i] * ... * g[j]) for j in period) < 1
+        #
+        # where i is the first year, as long as every g is positive.
+        # With prefix products of g and prefix sums of their
+        # reciprocals the sum takes constant time for any period.
+        products = [1.0, *itertools.accumulate(growth, operator.mul)]
+        sums = [0.0, *itertools.accumulate(1 / p for p in products[1:])]
+
+        starts = [start_year - first_year for start_year, _ in periods]
+        successes = sum(
+            withdrawal_rate * products[i] * (sums[i + duration] - sums[i])
+            < 1 for i in starts)
+
     success_rate = successes / len(periods)
     return round(success_rate, 2)
 
@@ -96,50 +128,59 @@ def simulate(returns, start_year, end_year, stock_allocation, withdrawal_rate):
     success : bool
         Whether the portfolio survived.
     """
-    # Simulations are independent of initial portfolio size,
-    # so use a fixed, realistic number.
-    balance = 1_000_000
+    balance = INITIAL_BALANCE
     withdrawal = balance * withdrawal_rate
 
-    for year in range(start_year, end_year + 1):
-        balance = update_portfolio(
-            returns[year], withdrawal, stock_allocation, balance)
+    stocks, bonds = extract_returns(returns, start_year, end_year)
+    for factor in growth_factors(stocks, bonds, stock_allocation):
+        # Withdrawals take place at the end of the year.
+        balance = balance * factor - withdrawal
 
     return balance > 0
 
 
-def update_portfolio(returns, withdrawal, stock_allocation, balance):
-    """Update a portfolio based on performance in a single year.
+def extract_returns(returns, start_year, end_year):
+    """Extract stock and bond returns into flat lists.
 
     Parameters
     ----------
     returns : dict
-        Stock and bond returns for a single year.
-    withdrawal : float
-        Amount to withdraw from the portfolio. The withdrawal
-        is assumed to take place at the end of the year after
-        adjusting for inflation.
+        Historical stock and bond returns by year.
+    start_year, end_year : int
+        Extract returns between these years.
+
+    Returns
+    -------
+    stocks, bonds : list of float
+        Stock and bond returns, one entry per year.
+    """
+    years = [returns[year] for year in range(start_year, end_year + 1)]
+    stocks = [year['stocks'] for year in years]
+    bonds = [year['bonds'] for year in years]
+    return stocks, bonds
+
+
+def growth_factors(stocks, bonds, stock_allocation):
+    """Calculate the annual growth of a portfolio.
+
+    Parameters
+    ----------
+    stocks, bonds : list of float
+        Stock and bond returns, one entry per year.
     stock_allocation : float
-        The fraction of the portfolio to allocate to equities.
-        The update calculations assume the portfolio is rebalanced
-        annually.
-    balance : float
-        Portfolio balance at the beginning of the year.
+        The fraction of the portfolio allocated to equities.
+        The portfolio is assumed to be rebalanced annually.
 
     Returns
     -------
-    balance : float
-        The balance at the and of the year after accounting for
-        all market gains and withdrawals.
+    list of float
+        Ratio of each year's ending balance to its starting
+        balance, before any withdrawals.
     """
-    return (
-        # stocks plus appreciation and dividends
-        balance * stock_allocation * (1 + returns['stocks'])
-        # bonds plus bond income
-        + balance * (1 - stock_allocation) * (1 + returns['bonds'])
-        # end of year withdrawal
-        - withdrawal
-    )
+    bond_allocation = 1 - stock_allocation
+    return [stock_allocation * (1 + stock_return)
+            + bond_allocation * (1 + bond_return)
+            for stock_return, bond_return in zip(stocks, bonds)]
 
 
 def get_periods(start_year, end_year, duration):
@@ -160,9 +201,5 @@ def get_periods(start_year, end_year, duration):
     list of tuple
         List of (start year, end year) pairs.
     """
-    periods = []
-    year = start_year
-    while year + duration - 1 <= end_year:
-        periods.append((year, year + duration - 1))
-        year += 1
-    return periods
+    return [(year, year + duration - 1)
+            for year in range(start_year, end_year - duration + 2)]
@@ -4,8 +4,8 @@ import trinity.returns as returns
 
 def test_simulate_returns(expected_bond_returns):
     """Ensure simulated returns match published results."""
-    interest_rates = [(year['rate'], year['rate_long'])
-                      for year in returns.read_shiller()]
+    shiller = returns.read_shiller()
+    interest_rates = zip(shiller['rate'], shiller['rate_long'])
 
     simulated_returns = bonds.simulate_returns(interest_rates)
 
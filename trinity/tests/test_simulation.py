@@ -42,6 +42,28 @@ def test_calc_success_rate(expected_outcomes):
     assert mae < 0.03
 
 
+@pytest.mark.parametrize('stock_allocation', [
+    0.0, 0.5, 1.0,
+    # Leveraged enough that some years wipe out the portfolio.
+    2.5,
+])
+@pytest.mark.parametrize('duration', [1, 15, 30])
+def test_calc_success_rate_matches_simulate(stock_allocation, duration):
+    """Ensure success rates agree with year-by-year simulations."""
+    returns = trinity.get_returns(1926, 2009)
+    periods = simulation.get_periods(1926, 2009, duration)
+    for withdrawal_rate in [0.0, 0.03, 0.05, 0.08, 0.12]:
+        successes = sum(
+            simulation.simulate(
+                returns, *period, stock_allocation, withdrawal_rate)
+            for period in periods)
+        expected = round(successes / len(periods), 2)
+
+        success_rate = simulation.calc_success_rate(
+            returns, stock_allocation, duration, withdrawal_rate)
+        assert success_rate == expected
+
+
 @pytest.mark.parametrize('duration,expected', [
     # These numbers are given in tables 1 and 3 in
     # the original study.